@@ -1,26 +1,36 @@
 from exceptions.gpm.auth_exceptions import AuthException
+from exceptions.spotify.auth_exceptions import SpotifyAuthException
 from exceptions.spotify.search_exceptions import NoMatchException
 from gmusicapi import Mobileclient
 from json import load
+from meta.structures.estimate import MigrationEstimate
 from meta.structures.track import GpmTrack, SpotifyTrack
 from spotipy import Spotify
+from spotipy.oauth2 import SpotifyOAuth
 from typing import List, Tuple
 from wrappers.gpm.api_wrapper import ApiWrapper
 from wrappers.gpm.auth_wrapper import AuthWrapper
+from wrappers.gpm.priority_wrapper import PriorityWrapper
+from wrappers.gpm.sync_wrapper import SyncWrapper
+from wrappers.spotify.estimate_wrapper import EstimateWrapper
 from wrappers.spotify.library_wrapper import LibraryWrapper
 from wrappers.spotify.search_wrapper import SearchWrapper
+from wrappers.spotify.token_manager import TokenManager
 from sys import argv
 
-import spotipy.util as util
-
 
 class CLI:
 
     @staticmethod
-    def run_cli(username: str):
+    def run_cli(username: str, estimate: bool = False, sync: bool = False):
         """
         This CLI Interface should just use basic prompts to get required tokens and migrate tracks to Spotify
 
+        Args:
+            username (str): The Spotify username to migrate tracks to
+            estimate (bool): Only estimate the cost of the migration from a sample of the library, without migrating
+            sync (bool): Only migrate the tracks added or modified since the last sync
+
         Returns:
             None
 
@@ -31,7 +41,10 @@ class CLI:
 
         # Load Spotify Config
         with open("cli-config.json") as config_file:
-            spotify_config: dict = load(config_file)['spotify']['client']
+            config: dict = load(config_file)
+
+        spotify_config: dict = config['spotify']['client']
+        migration_config: dict = config.get('migration', {})
 
         try:
             mobile_client: Mobileclient = AuthWrapper.authenticate_mobile_client(mobile_client=Mobileclient())
@@ -39,50 +52,135 @@ class CLI:
             print(f"Error getting an Authenticated Client for GPM:\n {e}")
             return
 
-        # Get tracks using API Wrapper
-        print("Getting your Library... ")
-        gpm_library: List[GpmTrack] = ApiWrapper.get_library(mobile_client=mobile_client)
-        print(f"Done. Found {len(gpm_library)} tracks")
+        # Get tracks using API Wrapper, an incremental sync only fetches the changes since the last sync
+        sync_state_path: str = migration_config.get('sync_state_path', 'sync-state.json')
+        high_water_mark: int = SyncWrapper.get_high_water_mark(state_path=sync_state_path, username=username)
+        latest_deletion: int = None
+
+        if sync and high_water_mark is not None:
+            print("Getting changes to your Library since the last sync... ")
+            gpm_library, deleted_track_ids, latest_deletion = ApiWrapper.get_library_changes(
+                mobile_client=mobile_client, updated_after=high_water_mark)
+            print(f"Done. Found {len(gpm_library)} new or modified tracks, {len(deleted_track_ids)} deleted tracks")
+
+            if len(gpm_library) == 0:
+                # Still move past any deletions, so the next sync doesn't report them again
+                SyncWrapper.complete_sync(state_path=sync_state_path, username=username, gpm_tracks=gpm_library,
+                                          high_water_mark=high_water_mark, failed_update_count=0,
+                                          latest_deletion=latest_deletion)
+                print("Nothing to sync")
+                return
+        else:
+            print("Getting your Library... ")
+            gpm_library: List[GpmTrack] = ApiWrapper.get_library(mobile_client=mobile_client)
+            print(f"Done. Found {len(gpm_library)} tracks")
 
         # Get Spotify Matches using Search Wrapper
-        auth_token: str = util.prompt_for_user_token(
-            username=username,
-            scope='user-library-read,user-library-modify',
-            client_id=spotify_config['id'],
-            client_secret=spotify_config['secret'],
-            redirect_uri=spotify_config['redirect_uri']
-        )
+        # The token manager keeps the access token fresh in the background, runs can outlive a single token
+        try:
+            token_manager: TokenManager = TokenManager(oauth=SpotifyOAuth(
+                username=username,
+                scope='user-library-read,user-library-modify',
+                client_id=spotify_config['id'],
+                client_secret=spotify_config['secret'],
+                redirect_uri=spotify_config['redirect_uri']
+            )).start()
+        except SpotifyAuthException as e:
+            print(f"Error getting an access token for Spotify:\n {e}")
+            return
+
+        spotify_client: Spotify = token_manager.get_spotify_client()
 
-        spotify_client: Spotify = Spotify(auth=auth_token)
+        if estimate:
+            CLI.print_estimate(spotify_client=spotify_client, gpm_library=gpm_library, migration_config=migration_config)
+            token_manager.stop()
+            return
+
+        # Uploads happen after each wave is matched, so ask before matching starts
+        user_response: str = input(f"Would you like to upload matches for {len(gpm_library)} tracks to Spotify as they're found? This action will not affect your GPM Library (y/n)\n> ")
+
+        if user_response == 'n':
+            print("Noted. Skipping Library Upload")
+        elif user_response != 'y':
+            print("Invalid response, try again")
+            token_manager.stop()
+            return
 
+        # Match and upload the library in waves, most played & thumbs up tracks first
         matched_tracks: List[Tuple[GpmTrack, SpotifyTrack]] = []
+        progress, failed_update_count = 0, 0
         print("Matching your GPM Library To Spotify Tracks...")
-        for progress, gpm_track in enumerate(gpm_library):
-            if progress % 100 == 0 and progress != 0:
-                print(f"Finished matching {progress} of {len(gpm_library)} tracks...")
-            try:
-                matched_tracks.append((gpm_track, SearchWrapper.get_spotify_match(spotify_client=spotify_client,
-                                                                                  gpm_track=gpm_track)))
-            except NoMatchException as e:
-                print(f"{e} - Skipping.")
+        for wave in PriorityWrapper.get_waves(gpm_library, wave_size=migration_config.get('wave_size', 250)):
+            wave_matches: List[Tuple[GpmTrack, SpotifyTrack]] = []
+            for gpm_track in wave:
+                if progress % 100 == 0 and progress != 0:
+                    print(f"Finished matching {progress} of {len(gpm_library)} tracks...")
+                progress += 1
+                try:
+                    wave_matches.append((gpm_track, token_manager.execute(
+                        lambda: SearchWrapper.get_spotify_match(spotify_client=spotify_client, gpm_track=gpm_track))))
+                except NoMatchException as e:
+                    print(f"{e} - Skipping.")
+
+            matched_tracks += wave_matches
+
+            if user_response == 'y':
+                print(f"Uploading {len(wave_matches)} tracks...")
+                failed_update_count += LibraryWrapper.update_user_library(
+                    spotify=spotify_client, uris=[spotify_track.get_uri() for (_, spotify_track) in wave_matches],
+                    token_manager=token_manager)
 
         print(f"Finished. Matched {len(matched_tracks)} of {len(gpm_library)} tracks")
-        # Update user's library
-        user_response: str = input(f"Would you like to upload {len(matched_tracks)} to Spotify? This action will not affect your GPM Library (y/n)\n> ")
 
+        # Only move the high-water mark once the changes have made it to Spotify, so failed uploads are retried
         if user_response == 'y':
-            print("Uploading...")
-            LibraryWrapper.update_user_library(spotify=spotify_client, uris=[spotify_track.get_uri() for (_, spotify_track)
-                                                                             in matched_tracks])
-        elif user_response == 'n':
-            print("Noted. Skipping Library Upload")
-        else:
-            print("Invalid response, try again")
+            SyncWrapper.complete_sync(state_path=sync_state_path, username=username, gpm_tracks=gpm_library,
+                                      high_water_mark=high_water_mark, failed_update_count=failed_update_count,
+                                      latest_deletion=latest_deletion)
+
+            if failed_update_count > 0:
+                print(f"Failed to upload {failed_update_count} tracks, they will be retried by the next sync")
+
+        token_manager.stop()
+
+    @staticmethod
+    def print_estimate(spotify_client: Spotify, gpm_library: List[GpmTrack], migration_config: dict):
+        """
+        Estimate the cost of migrating the library from a sample of it, and print the estimate
+
+        Args:
+            spotify_client (Spotify): An authenticated Spotify Client
+            gpm_library (List[GpmTrack]): The user's GPM library
+            migration_config (dict): The migration section of the CLI config, with the sample size, number of workers
+                and rate limit to estimate for
+
+        Returns:
+            None
+
+        """
+
+        print("Estimating the cost of migrating your Library...")
+        estimate: MigrationEstimate = EstimateWrapper.estimate_migration(
+            spotify_client=spotify_client,
+            gpm_library=gpm_library,
+            sample_size=migration_config.get('sample_size', 100),
+            workers=migration_config.get('workers', 1),
+            requests_per_second=migration_config.get('requests_per_second')
+        )
+
+        print(f"Library: {estimate.library_size} tracks, {estimate.get_duplicate_count()} duplicates, "
+              f"{estimate.album_count} albums ({estimate.get_tracks_per_album():.1f} tracks per album)")
+        print(f"Sampled {estimate.sample_size} tracks: {estimate.match_rate:.1%} matched, "
+              f"{estimate.searches_per_track:.2f} searches per track, {estimate.match_time:.2f}s per track")
+        print(f"Expected: {estimate.search_calls} search calls, {estimate.upload_batches} upload batches, "
+              f"{estimate.expected_misses} tracks without a match")
+        print(f"Expected duration: {estimate.wall_time / 60:.1f} minutes")
 
 
 if __name__ == '__main__':
     if not argv[1]:
-        print("You must provide a username to be used with the CLI in the form python command_line_interface.py <username>")
+        print("You must provide a username to be used with the CLI in the form python command_line_interface.py "
+              "<username> [--estimate] [--sync]")
 
     username: str = argv[1]
-    CLI.run_cli(username=username)
+    CLI.run_cli(username=username, estimate='--estimate' in argv[2:], sync='--sync' in argv[2:])
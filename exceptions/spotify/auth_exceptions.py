@@ -0,0 +1,10 @@
+class SpotifyAuthException(Exception):
+    """
+    This exception is thrown when we fail to acquire or refresh an access token for the Spotify API
+
+    Args:
+        message (str): Description of the exception
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
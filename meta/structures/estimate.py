@@ -0,0 +1,39 @@
+class MigrationEstimate:
+    """
+    A class used to describe the expected cost of migrating a GPM library to Spotify, extrapolated from a sample of the
+    library by the ``EstimateWrapper``
+
+    Attributes:
+        library_size (int): The number of tracks in the GPM library
+        unique_tracks (int): The number of tracks left once duplicates (same title, artist & album) are removed
+        album_count (int): The number of distinct albums in the library
+        sample_size (int): The number of tracks that were actually matched against Spotify
+        match_rate (float): The fraction of the sample that found a match on Spotify
+        searches_per_track (float): The average number of search calls made per track in the sample
+        match_time (float): The average time in seconds it took to match a track in the sample, searches included
+        search_calls (int): The expected number of search calls for the whole library
+        upload_batches (int): The expected number of calls needed to upload the matches to the user's library
+        expected_misses (int): The expected number of tracks that won't find a match
+        wall_time (float): The expected duration of the migration in seconds
+    """
+
+    def __init__(self, library_size: int, unique_tracks: int, album_count: int, sample_size: int, match_rate: float,
+                 searches_per_track: float, match_time: float, search_calls: int, upload_batches: int,
+                 expected_misses: int, wall_time: float):
+        self.library_size: int = library_size
+        self.unique_tracks: int = unique_tracks
+        self.album_count: int = album_count
+        self.sample_size: int = sample_size
+        self.match_rate: float = match_rate
+        self.searches_per_track: float = searches_per_track
+        self.match_time: float = match_time
+        self.search_calls: int = search_calls
+        self.upload_batches: int = upload_batches
+        self.expected_misses: int = expected_misses
+        self.wall_time: float = wall_time
+
+    def get_duplicate_count(self) -> int:
+        return self.library_size - self.unique_tracks
+
+    def get_tracks_per_album(self) -> float:
+        return self.library_size / self.album_count if self.album_count else 0.0
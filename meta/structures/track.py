@@ -14,12 +14,19 @@ class GpmTrack:
         album (str): The name of the album the track belongs to
         year (str): The year the track was released
         genre (str): The genre of the track
+        play_count (int): The number of times the user has played the track
+        rating (int): The user's rating of the track, 5 is a thumbs up and 1 is a thumbs down
+        last_played (int): Timestamp in microseconds of the user's most recent interaction with the track
+        track_id (str): The id of the track in the user's GPM library
+        last_modified (int): Timestamp in microseconds of when the track was last modified in the user's GPM library
 
     Raises:
         GpmMalformedTrackException: When trying to create a GpmTrack without at least one of the mandatory attributes.
     """
 
-    def __init__(self, title: str, artist: str, album: str = None, year: str = None, genre: str = None):
+    def __init__(self, title: str, artist: str, album: str = None, year: str = None, genre: str = None,
+                 play_count: int = 0, rating: int = None, last_played: int = None, track_id: str = None,
+                 last_modified: int = None):
         if title is None or artist is None:
             raise GpmMalformedTrackException("Title and Artist cannot be None.")
 
@@ -28,6 +35,11 @@ class GpmTrack:
         self.album: str = album
         self.year: str = year
         self.genre: str = genre
+        self.play_count: int = play_count
+        self.rating: int = rating
+        self.last_played: int = last_played
+        self.track_id: str = track_id
+        self.last_modified: int = last_modified
 
     def get_title(self) -> str:
         return self.title
@@ -44,6 +56,21 @@ class GpmTrack:
     def get_genre(self) -> str:
         return self.genre
 
+    def get_play_count(self) -> int:
+        return self.play_count
+
+    def get_rating(self) -> int:
+        return self.rating
+
+    def get_last_played(self) -> int:
+        return self.last_played
+
+    def get_track_id(self) -> str:
+        return self.track_id
+
+    def get_last_modified(self) -> int:
+        return self.last_modified
+
     @staticmethod
     def __normalise(input: str) -> str:
         """
@@ -70,6 +97,7 @@ class SpotifyTrack:
         score (int): Score of the match for this Spotify Track with the original GPM Track
         year (str): The year the track was released
         genre (str): The genre of the track
+        duration (int): The length of the track in milliseconds
 
     Raises:
         SpotifyMalformedTrackException: When trying to create a Spotify Track without at least one of the mandatory
@@ -77,7 +105,7 @@ class SpotifyTrack:
     """
 
     def __init__(self, title: str, artist: str, uri: str, album: str = None, album_art_url: str = None,
-                 score: int = None, year: str = None, genre: str = None):
+                 score: int = None, year: str = None, genre: str = None, duration: int = None):
         if title is None or artist is None or uri is None:
             raise SpotifyMalformedTrackException("Title, Artist & URI Cannot be None")
 
@@ -89,6 +117,7 @@ class SpotifyTrack:
         self.score: int = score
         self.year: str = year
         self.genre: str = genre
+        self.duration: int = duration
 
     def set_score(self, score: int):
         self.score = score
@@ -110,3 +139,6 @@ class SpotifyTrack:
 
     def get_uri(self) -> str:
         return self.uri
+
+    def get_duration(self) -> int:
+        return self.duration
@@ -0,0 +1,176 @@
+from json import dump, load
+from meta.structures.track import GpmTrack, SpotifyTrack
+from os import environ
+from sys import version_info
+from timeit import Timer
+from typing import Callable, Tuple
+from wrappers.spotify.search_wrapper import SearchWrapper
+
+import tracemalloc
+import unittest
+
+BASELINES_PATH: str = 'test/resources/benchmarks/hot_path_baselines.json'
+
+# How much slower, or how many more bytes, a function may get before the benchmark fails. 0.5 allows 50% slower.
+THRESHOLD: float = float(environ.get('BENCHMARK_THRESHOLD', 0.5))
+
+# Set BENCHMARK_UPDATE=1 to store the current measurements as the new baselines instead of comparing against them
+UPDATE_BASELINES: bool = environ.get('BENCHMARK_UPDATE') == '1'
+
+# The benchmarks take a few seconds, so they only run when asked for with BENCHMARK=1 or BENCHMARK_UPDATE=1
+RUN_BENCHMARKS: bool = environ.get('BENCHMARK') == '1' or UPDATE_BASELINES
+
+# Timings and allocations differ between interpreter versions, so baselines are stored for each one
+PYTHON_VERSION: str = f"{version_info[0]}.{version_info[1]}"
+
+
+def calibrate():
+    """
+    A fixed amount of pure python work. Timings are stored relative to this, so baselines recorded on one machine still
+    mean something on another.
+    """
+    return sorted(str(i) for i in range(200))
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, "Benchmarks only run with BENCHMARK=1")
+class HotPathBenchmark(unittest.TestCase):
+    """
+    Micro-benchmarks for the code that runs for every track in a migration. Each function's speed relative to the
+    calibration workload, and the peak memory it allocates per call, are compared against the baselines stored for the
+    running python version.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with open('test/resources/spotify/search_results.json', 'rb') as search_results_file:
+            cls.search_response: bytes = search_results_file.read()
+            search_results_file.seek(0)
+            cls.search_result: dict = load(search_results_file)['tracks']['items'][0]
+
+        cls.gpm_track: GpmTrack = GpmTrack(title='Any Colour You Like (2011 Remaster)', artist='Pink Floyd',
+                                           album='The Dark Side of the Moon', year='1973')
+        cls.spotify_track: SpotifyTrack = SearchWrapper._SearchWrapper__parse_result_to_track(cls.search_result)
+
+        with open(BASELINES_PATH) as baselines_file:
+            cls.all_baselines: dict = load(baselines_file)
+
+        # A missing version fails every benchmark rather than skipping them, a skipped suite would guard nothing
+        cls.baselines: dict = cls.all_baselines.setdefault(PYTHON_VERSION, {}) if UPDATE_BASELINES else \
+            cls.all_baselines.get(PYTHON_VERSION)
+
+        cls.calibration_timer: Timer = Timer(calibrate)
+        cls.calibration_number: int = HotPathBenchmark.__get_number(cls.calibration_timer)
+        cls.measurements: dict = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE_BASELINES:
+            cls.baselines.update(cls.measurements)
+
+            with open(BASELINES_PATH, 'w') as baselines_file:
+                dump(cls.all_baselines, baselines_file, indent=2, sort_keys=True)
+                baselines_file.write('\n')
+
+    @staticmethod
+    def __get_number(timer: Timer) -> int:
+        """
+        Returns:
+            int: How many calls to time per round so a round takes roughly 50ms
+        """
+        number, time_taken = timer.autorange()
+
+        return max(1, int(number * 0.05 / time_taken))
+
+    def __time_per_call(self, function: Callable, rounds: int = 7) -> Tuple[float, float]:
+        """
+        Time the function and the calibration workload in alternating rounds, so both see the same machine load, and keep
+        the best round of each, the least noisy measure on a busy machine
+
+        Returns:
+            Tuple[float, float]: The seconds per call of the function and of the calibration workload
+        """
+        timer: Timer = Timer(function)
+        number: int = HotPathBenchmark.__get_number(timer)
+
+        best_time, best_calibration_time = float('inf'), float('inf')
+        for _ in range(rounds):
+            best_calibration_time = min(best_calibration_time,
+                                        self.calibration_timer.timeit(self.calibration_number) / self.calibration_number)
+            best_time = min(best_time, timer.timeit(number) / number)
+
+        return best_time, best_calibration_time
+
+    @staticmethod
+    def __allocated_per_call(function: Callable) -> int:
+        """
+        Returns:
+            int: The peak bytes allocated by python during a single call
+        """
+        function()
+
+        tracemalloc.start()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return peak
+
+    def __benchmark(self, name: str, function: Callable):
+        time_per_call, calibration_time = self.__time_per_call(function)
+        measurement: dict = {
+            'relative_time': time_per_call / calibration_time,
+            'allocated_bytes': HotPathBenchmark.__allocated_per_call(function)
+        }
+        self.measurements[name] = measurement
+
+        if UPDATE_BASELINES:
+            return
+
+        if self.baselines is None:
+            self.fail(f"No benchmark baselines for python {PYTHON_VERSION}, baselines are stored for "
+                      f"{', '.join(sorted(self.all_baselines))}. Run the benchmarks on one of those versions, or record "
+                      f"baselines for {PYTHON_VERSION} with BENCHMARK_UPDATE=1")
+
+        baseline: dict = self.baselines.get(name)
+        self.assertIsNotNone(baseline, f"No baseline for {name} on python {PYTHON_VERSION}, run the benchmarks with "
+                                       f"BENCHMARK_UPDATE=1")
+
+        slowdown: float = measurement['relative_time'] / baseline['relative_time'] - 1
+        self.assertLessEqual(slowdown, THRESHOLD,
+                             f"{name} is {slowdown:.0%} slower than its baseline, the threshold is {THRESHOLD:.0%}. "
+                             f"Now {1 / time_per_call:,.0f} ops/sec, baseline "
+                             f"{1 / (baseline['relative_time'] * calibration_time):,.0f} ops/sec on this machine. "
+                             f"If this is expected, run the benchmarks with BENCHMARK_UPDATE=1")
+
+        growth: float = measurement['allocated_bytes'] / baseline['allocated_bytes'] - 1
+        self.assertLessEqual(growth, THRESHOLD,
+                             f"{name} allocates {growth:.0%} more than its baseline, the threshold is {THRESHOLD:.0%}. "
+                             f"Now {measurement['allocated_bytes']} bytes per call, baseline "
+                             f"{baseline['allocated_bytes']} bytes. If this is expected, run the benchmarks with "
+                             f"BENCHMARK_UPDATE=1")
+
+    def test_gpm_track_init(self):
+        self.__benchmark('GpmTrack.__init__', lambda: GpmTrack(title='Any Colour You Like (2011 Remaster)',
+                                                               artist='Pink Floyd', album='The Dark Side of the Moon',
+                                                               year='1973'))
+
+    def test_gpm_track_normalise(self):
+        self.__benchmark('GpmTrack.__normalise',
+                         lambda: GpmTrack._GpmTrack__normalise('Any Colour You Like (2011 Remaster), Pink Floyd\'s'))
+
+    def test_get_search_query(self):
+        self.__benchmark('SearchWrapper.__get_search_query',
+                         lambda: SearchWrapper._SearchWrapper__get_search_query(gpm_track=self.gpm_track))
+
+    def test_parse_result_to_track(self):
+        self.__benchmark('SearchWrapper.__parse_result_to_track',
+                         lambda: SearchWrapper._SearchWrapper__parse_result_to_track(self.search_result))
+
+    def test_parse_search_response(self):
+        self.__benchmark('SearchWrapper.parse_search_response',
+                         lambda: SearchWrapper.parse_search_response(self.search_response))
+
+    def test_score_match(self):
+        self.__benchmark('SearchWrapper.__score_match',
+                         lambda: SearchWrapper._SearchWrapper__score_match(gpm_track=self.gpm_track,
+                                                                           spotify_track=self.spotify_track))
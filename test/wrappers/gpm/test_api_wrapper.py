@@ -1,10 +1,13 @@
 from exceptions.gpm.api_exceptions import GpmMalformedTrackException, UnauthenticatedClientException
 from gmusicapi import Mobileclient
+from gmusicapi.utils import utils
+from os import environ
 from meta.structures.track import GpmTrack
 from typing import List
 from unittest.mock import MagicMock
 from wrappers.gpm.api_wrapper import ApiWrapper
 
+import time
 import unittest
 
 
@@ -36,6 +39,75 @@ class ApiWrapperTest(unittest.TestCase):
         mock_mobile_client.is_authenticated.assert_called_once()
         mock_mobile_client.get_all_songs.assert_called_once()
 
+    def test_get_library_with_priority_fields(self):
+        # Set up our mocked mobile client
+        mock_mobile_client: Mobileclient = MagicMock(Mobileclient)
+        mock_mobile_client.is_authenticated.return_value = True
+        mock_mobile_client.get_all_songs.return_value = [
+            {
+                'title': 'Test Title',
+                'artist': 'Test Artist',
+                'playCount': 12,
+                'rating': '5',
+                'recentTimestamp': '1577836800000000'
+            }
+        ]
+
+        tracks: List[GpmTrack] = ApiWrapper.get_library(mobile_client=mock_mobile_client)
+
+        self.assertEqual(12, tracks[0].get_play_count())
+        self.assertEqual(5, tracks[0].get_rating())
+        self.assertEqual(1577836800000000, tracks[0].get_last_played())
+
+    def test_get_library_changes(self):
+        # Set up our mocked mobile client
+        mock_mobile_client: Mobileclient = MagicMock(Mobileclient)
+        mock_mobile_client.is_authenticated.return_value = True
+        mock_mobile_client.get_all_songs.return_value = [
+            {
+                'id': 'modified-track',
+                'title': 'Test Title',
+                'artist': 'Test Artist',
+                'lastModifiedTimestamp': '1577836800000001',
+                'deleted': False
+            },
+            {
+                'id': 'deleted-track',
+                'lastModifiedTimestamp': '1577836800000002',
+                'deleted': True
+            }
+        ]
+
+        updated_tracks, deleted_track_ids, latest_deletion = ApiWrapper.get_library_changes(
+            mobile_client=mock_mobile_client, updated_after=1577836800000000)
+
+        self.assertEqual(['modified-track'], [track.get_track_id() for track in updated_tracks])
+        self.assertEqual(1577836800000001, updated_tracks[0].get_last_modified())
+        self.assertEqual(['deleted-track'], deleted_track_ids)
+        self.assertEqual(1577836800000002, latest_deletion)
+
+        # gmusicapi turns the datetime back into the timestamp it sends to Skyjam
+        mock_mobile_client.get_all_songs.assert_called_once()
+        self.assertEqual(1577836800000000, utils.datetime_to_microseconds(
+            mock_mobile_client.get_all_songs.call_args[1]['updated_after']))
+
+    @unittest.skipUnless(hasattr(time, 'tzset'), "Changing the timezone needs time.tzset")
+    def test_get_library_changes_outside_utc(self):
+        original_timezone: str = environ.get('TZ')
+
+        try:
+            for timezone in ('America/New_York', 'Asia/Tokyo'):
+                environ['TZ'] = timezone
+                time.tzset()
+
+                self.test_get_library_changes()
+        finally:
+            if original_timezone is None:
+                del environ['TZ']
+            else:
+                environ['TZ'] = original_timezone
+            time.tzset()
+
     def test_get_library_with_unauthenticated_client(self):
         # Set up our mocked mobile client
         mock_mobile_client: Mobileclient = MagicMock(Mobileclient)
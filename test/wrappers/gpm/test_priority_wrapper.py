@@ -0,0 +1,35 @@
+from meta.structures.track import GpmTrack
+from typing import List
+from unittest import TestCase
+from wrappers.gpm.priority_wrapper import PriorityWrapper
+
+
+class PriorityWrapperTest(TestCase):
+    """
+    The PriorityWrapper should split the library into waves with the most valuable tracks first
+    """
+
+    def test_get_waves(self):
+        gpm_library: List[GpmTrack] = [
+            GpmTrack(title='Never Played', artist='Test Artist'),
+            GpmTrack(title='Thumbs Down', artist='Test Artist', play_count=100, rating=1),
+            GpmTrack(title='Played Often', artist='Test Artist', play_count=40),
+            GpmTrack(title='Thumbs Up', artist='Test Artist', play_count=20, rating=5),
+            GpmTrack(title='Played Recently', artist='Test Artist', last_played=1577836800000000)
+        ]
+
+        waves: List[List[GpmTrack]] = list(PriorityWrapper.get_waves(gpm_library, wave_size=2))
+
+        self.assertEqual([2, 2, 1], [len(wave) for wave in waves])
+        self.assertEqual(['Thumbs Up', 'Played Often', 'Played Recently', 'Never Played', 'Thumbs Down'],
+                         [gpm_track.get_title() for wave in waves for gpm_track in wave])
+
+    def test_get_waves_with_empty_library(self):
+        self.assertEqual([], list(PriorityWrapper.get_waves([])))
+
+    def test_get_waves_with_invalid_wave_size(self):
+        gpm_library: List[GpmTrack] = [GpmTrack(title='Test Title', artist='Test Artist')]
+
+        for wave_size in (0, -1):
+            with self.assertRaises(ValueError):
+                list(PriorityWrapper.get_waves(gpm_library, wave_size=wave_size))
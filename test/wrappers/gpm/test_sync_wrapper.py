@@ -0,0 +1,95 @@
+from gmusicapi import Mobileclient
+from meta.structures.track import GpmTrack
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrappers.gpm.api_wrapper import ApiWrapper
+from wrappers.gpm.sync_wrapper import SyncWrapper
+
+
+class SyncWrapperTest(TestCase):
+    """
+    The SyncWrapper should store a high-water mark per user, so incremental syncs only fetch the changes since
+    """
+
+    def test_save_and_get_high_water_mark(self):
+        with TemporaryDirectory() as state_directory:
+            state_path: str = join(state_directory, 'sync-state.json')
+
+            SyncWrapper.save_high_water_mark(state_path=state_path, username='first_user', high_water_mark=1)
+            SyncWrapper.save_high_water_mark(state_path=state_path, username='second_user', high_water_mark=2)
+
+            self.assertEqual(1, SyncWrapper.get_high_water_mark(state_path=state_path, username='first_user'))
+            self.assertEqual(2, SyncWrapper.get_high_water_mark(state_path=state_path, username='second_user'))
+
+    def test_get_high_water_mark_without_previous_sync(self):
+        with TemporaryDirectory() as state_directory:
+            self.assertIsNone(SyncWrapper.get_high_water_mark(state_path=join(state_directory, 'sync-state.json'),
+                                                              username='test_user'))
+
+    def test_get_latest_modification(self):
+        gpm_tracks: List[GpmTrack] = [
+            GpmTrack(title='First Title', artist='Test Artist', last_modified=5),
+            GpmTrack(title='Second Title', artist='Test Artist', last_modified=9),
+            GpmTrack(title='Third Title', artist='Test Artist')
+        ]
+
+        self.assertEqual(9, SyncWrapper.get_latest_modification(gpm_tracks=gpm_tracks, high_water_mark=3))
+        self.assertEqual(3, SyncWrapper.get_latest_modification(gpm_tracks=[], high_water_mark=3))
+        self.assertIsNone(SyncWrapper.get_latest_modification(gpm_tracks=[]))
+
+    def test_complete_sync(self):
+        gpm_tracks: List[GpmTrack] = [GpmTrack(title='Test Title', artist='Test Artist', last_modified=9)]
+
+        with TemporaryDirectory() as state_directory:
+            state_path: str = join(state_directory, 'sync-state.json')
+            SyncWrapper.save_high_water_mark(state_path=state_path, username='test_user', high_water_mark=3)
+
+            self.assertTrue(SyncWrapper.complete_sync(state_path=state_path, username='test_user',
+                                                      gpm_tracks=gpm_tracks, high_water_mark=3, failed_update_count=0))
+            self.assertEqual(9, SyncWrapper.get_high_water_mark(state_path=state_path, username='test_user'))
+
+    def test_complete_sync_with_failed_upload(self):
+        gpm_tracks: List[GpmTrack] = [GpmTrack(title='Test Title', artist='Test Artist', last_modified=9)]
+
+        with TemporaryDirectory() as state_directory:
+            state_path: str = join(state_directory, 'sync-state.json')
+            SyncWrapper.save_high_water_mark(state_path=state_path, username='test_user', high_water_mark=3)
+
+            self.assertFalse(SyncWrapper.complete_sync(state_path=state_path, username='test_user',
+                                                       gpm_tracks=gpm_tracks, high_water_mark=3,
+                                                       failed_update_count=1))
+            self.assertEqual(3, SyncWrapper.get_high_water_mark(state_path=state_path, username='test_user'))
+
+    def test_complete_sync_with_only_deletions(self):
+        # Set up our mocked mobile client, the only changes since the last sync are deletions
+        mock_mobile_client: Mobileclient = MagicMock(Mobileclient)
+        mock_mobile_client.is_authenticated.return_value = True
+        mock_mobile_client.get_all_songs.return_value = [
+            {
+                'id': 'first-deleted-track',
+                'lastModifiedTimestamp': '1577836800000005',
+                'deleted': True
+            },
+            {
+                'id': 'second-deleted-track',
+                'lastModifiedTimestamp': '1577836800000009',
+                'deleted': True
+            }
+        ]
+
+        updated_tracks, _, latest_deletion = ApiWrapper.get_library_changes(mobile_client=mock_mobile_client,
+                                                                            updated_after=1577836800000000)
+
+        with TemporaryDirectory() as state_directory:
+            state_path: str = join(state_directory, 'sync-state.json')
+            SyncWrapper.save_high_water_mark(state_path=state_path, username='test_user',
+                                             high_water_mark=1577836800000000)
+
+            self.assertTrue(SyncWrapper.complete_sync(state_path=state_path, username='test_user',
+                                                      gpm_tracks=updated_tracks, high_water_mark=1577836800000000,
+                                                      failed_update_count=0, latest_deletion=latest_deletion))
+            self.assertEqual(1577836800000009, SyncWrapper.get_high_water_mark(state_path=state_path,
+                                                                               username='test_user'))
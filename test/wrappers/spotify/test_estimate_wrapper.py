@@ -0,0 +1,80 @@
+from json import load
+from meta.structures.estimate import MigrationEstimate
+from meta.structures.track import GpmTrack
+from spotipy import Spotify
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrappers.spotify.estimate_wrapper import EstimateWrapper
+from wrappers.spotify.lean_spotify import LeanSpotify
+
+
+class EstimateWrapperTest(TestCase):
+    """
+    The EstimateWrapper should match a sample of the library and extrapolate the cost of migrating all of it
+    """
+
+    def test_estimate_migration(self):
+        gpm_library: List[GpmTrack] = [GpmTrack(title=f'Title {i}', artist='Pink Floyd', album=f'Album {i % 10}')
+                                       for i in range(200)]
+        # Duplicate the first 50 tracks
+        gpm_library += gpm_library[:50]
+
+        mock_spotify_client: Spotify = MagicMock(Spotify)
+        with open('test/resources/spotify/search_results.json', 'r') as search_results_file:
+            mock_spotify_client.search.return_value = load(search_results_file)
+
+        search_method = mock_spotify_client.search
+
+        estimate: MigrationEstimate = EstimateWrapper.estimate_migration(spotify_client=mock_spotify_client,
+                                                                         gpm_library=gpm_library, sample_size=20,
+                                                                         seed=0)
+
+        # The client passed in should be left as it was
+        self.assertIs(search_method, mock_spotify_client.search)
+        self.assertGreater(estimate.match_time, 0.0)
+
+        self.assertEqual(250, estimate.library_size)
+        self.assertEqual(50, estimate.get_duplicate_count())
+        self.assertEqual(10, estimate.album_count)
+        self.assertEqual(20, estimate.sample_size)
+        self.assertEqual(20, mock_spotify_client.search.call_count)
+        self.assertEqual(1.0, estimate.match_rate)
+        self.assertEqual(250, estimate.search_calls)
+        self.assertEqual(5, estimate.upload_batches)
+        self.assertEqual(0, estimate.expected_misses)
+
+    def test_estimate_migration_with_no_matches(self):
+        gpm_library: List[GpmTrack] = [GpmTrack(title=f'Title {i}', artist='Test Artist') for i in range(100)]
+
+        mock_spotify_client: Spotify = MagicMock(Spotify)
+        with open('test/resources/spotify/empty_search_results.json', 'r') as search_results_file:
+            mock_spotify_client.search.return_value = load(search_results_file)
+
+        estimate: MigrationEstimate = EstimateWrapper.estimate_migration(spotify_client=mock_spotify_client,
+                                                                         gpm_library=gpm_library, sample_size=10,
+                                                                         requests_per_second=10, seed=0)
+
+        self.assertEqual(0.0, estimate.match_rate)
+        self.assertEqual(200, estimate.search_calls)
+        self.assertEqual(100, estimate.expected_misses)
+        self.assertEqual(0, estimate.upload_batches)
+        self.assertEqual(20.0, estimate.wall_time)
+
+    def test_estimate_migration_with_raw_search(self):
+        gpm_library: List[GpmTrack] = [GpmTrack(title=f'Title {i}', artist='Pink Floyd', album='Test Album')
+                                       for i in range(100)]
+
+        mock_spotify_client: LeanSpotify = MagicMock(LeanSpotify)
+        with open('test/resources/spotify/search_results.json', 'rb') as search_results_file:
+            mock_spotify_client.search_raw.return_value = search_results_file.read()
+
+        estimate: MigrationEstimate = EstimateWrapper.estimate_migration(spotify_client=mock_spotify_client,
+                                                                         gpm_library=gpm_library, sample_size=10,
+                                                                         seed=0)
+
+        # Searches made through search_raw should be counted, and spotipy's parsed search never used
+        self.assertEqual(10, mock_spotify_client.search_raw.call_count)
+        mock_spotify_client.search.assert_not_called()
+        self.assertEqual(1.0, estimate.searches_per_track)
+        self.assertEqual(100, estimate.search_calls)
@@ -0,0 +1,52 @@
+from requests import Response, Session
+from requests.exceptions import HTTPError
+from spotipy import SpotifyException
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrappers.spotify.lean_spotify import LeanSpotify
+
+
+class LeanSpotifyTest(TestCase):
+    """
+    The LeanSpotify client should return the raw body of a search response, and raise the same exceptions as spotipy
+    """
+
+    def test_search_raw(self):
+        with open('test/resources/spotify/search_results.json', 'rb') as search_results_file:
+            search_response: bytes = search_results_file.read()
+
+        mock_response: Response = MagicMock(Response)
+        mock_response.content = search_response
+
+        spotify_client: LeanSpotify = LeanSpotify(auth='test_token', language='fr')
+        spotify_client._session = MagicMock(Session)
+        spotify_client._session.get.return_value = mock_response
+
+        result: bytes = spotify_client.search_raw(q='track:"Any Colour You Like"', limit=50)
+
+        self.assertEqual(search_response, result)
+
+        headers: dict = spotify_client._session.get.call_args[1]['headers']
+        self.assertEqual('Bearer test_token', headers['Authorization'])
+        self.assertEqual('fr', headers['Accept-Language'])
+        self.assertEqual(50, spotify_client._session.get.call_args[1]['params']['limit'])
+
+    def test_search_raw_with_expired_token(self):
+        mock_error_response: Response = MagicMock(Response)
+        mock_error_response.status_code = 401
+        mock_error_response.url = 'https://api.spotify.com/v1/search'
+        mock_error_response.headers = {}
+        mock_error_response.text = '{"error": {"status": 401, "message": "The access token expired"}}'
+
+        mock_response: Response = MagicMock(Response)
+        mock_response.raise_for_status.side_effect = HTTPError(response=mock_error_response)
+
+        spotify_client: LeanSpotify = LeanSpotify(auth='test_token')
+        spotify_client._session = MagicMock(Session)
+        spotify_client._session.get.return_value = mock_response
+
+        with self.assertRaises(SpotifyException) as context:
+            spotify_client.search_raw(q='track:"Any Colour You Like"')
+
+        self.assertEqual(401, context.exception.http_status)
+        self.assertNotIn('Accept-Language', spotify_client._session.get.call_args[1]['headers'])
@@ -2,7 +2,9 @@ from exceptions.spotify.search_exceptions import NoMatchException
 from json import load
 from meta.structures.track import GpmTrack, SpotifyTrack
 from spotipy import Spotify
+from typing import List
 from unittest.mock import MagicMock
+from wrappers.spotify.lean_spotify import LeanSpotify
 from wrappers.spotify.search_wrapper import SearchWrapper
 
 import unittest
@@ -52,3 +54,36 @@ class SearchWrapperTest(unittest.TestCase):
 
         self.assertEqual(NoMatchException, type(context.exception), "No match found for Gpm Track")
         self.assertEqual(2, mock_spotify_client.search.call_count)
+
+    def test_get_spotify_match_with_raw_search(self):
+        gpm_track: GpmTrack = GpmTrack(title='Any Colour You Like', artist='Pink Floyd',
+                                       album='The Dark Side of the Moon')
+
+        mock_spotify_client: LeanSpotify = MagicMock(LeanSpotify)
+        with open('test/resources/spotify/search_results.json', 'rb') as search_results_file:
+            mock_spotify_client.search_raw.return_value = search_results_file.read()
+
+        result: SpotifyTrack = SearchWrapper.get_spotify_match(spotify_client=mock_spotify_client, gpm_track=gpm_track)
+
+        self.assertEqual('Any Colour You Like - 2011 Remastered Version', result.get_title())
+        self.assertEqual('spotify:track:1wGoqD0vrf7njGvxm8CEf5', result.get_uri())
+
+        mock_spotify_client.search_raw.assert_called_once()
+        mock_spotify_client.search.assert_not_called()
+
+    def test_parse_search_response(self):
+        with open('test/resources/spotify/search_results.json', 'rb') as search_results_file:
+            results: List[SpotifyTrack] = SearchWrapper.parse_search_response(search_results_file.read())
+
+        self.assertEqual(1, len(results))
+        self.assertEqual('Pink Floyd', results[0].get_artist())
+        self.assertEqual('The Dark Side Of The Moon [Remastered] (Remastered Version)', results[0].get_album())
+        self.assertEqual('1973', results[0].get_year())
+        self.assertEqual('https://i.scdn.co/image/ab67616d0000b27331c57b302f0e3aca46ab7561', results[0].album_art_url)
+        self.assertEqual(int, type(results[0].get_duration()))
+
+    def test_parse_empty_search_response(self):
+        with open('test/resources/spotify/empty_search_results.json', 'rb') as search_results_file:
+            results: List[SpotifyTrack] = SearchWrapper.parse_search_response(search_results_file.read())
+
+        self.assertEqual([], results)
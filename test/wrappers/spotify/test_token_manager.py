@@ -0,0 +1,101 @@
+from exceptions.spotify.auth_exceptions import SpotifyAuthException
+from spotipy import SpotifyException
+from spotipy.oauth2 import SpotifyOAuth
+from time import sleep, time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from wrappers.spotify.token_manager import TokenManager
+
+
+class TokenManagerTest(TestCase):
+    """
+    The TokenManager should keep a fresh access token for long running migrations, and retry requests once after
+    refreshing an expired token
+    """
+
+    @staticmethod
+    def __get_mock_oauth() -> SpotifyOAuth:
+        mock_oauth: SpotifyOAuth = MagicMock(SpotifyOAuth)
+        mock_oauth.cache_handler = MagicMock()
+        mock_oauth.validate_token.return_value = {
+            'access_token': 'first_token',
+            'refresh_token': 'refresh_token',
+            'expires_at': int(time()) + 3600
+        }
+        mock_oauth.refresh_access_token.return_value = {
+            'access_token': 'second_token',
+            'refresh_token': 'refresh_token',
+            'expires_at': int(time()) + 3600
+        }
+
+        return mock_oauth
+
+    def test_start(self):
+        mock_oauth: SpotifyOAuth = TokenManagerTest.__get_mock_oauth()
+
+        token_manager: TokenManager = TokenManager(oauth=mock_oauth).start()
+
+        self.assertEqual('first_token', token_manager.get_access_token())
+        mock_oauth.get_auth_response.assert_not_called()
+        token_manager.stop()
+
+    def test_start_with_failed_auth(self):
+        mock_oauth: SpotifyOAuth = TokenManagerTest.__get_mock_oauth()
+        mock_oauth.validate_token.side_effect = Exception('Mimicking network exception here')
+
+        with self.assertRaises(SpotifyAuthException) as context:
+            TokenManager(oauth=mock_oauth).start()
+
+        self.assertEqual(SpotifyAuthException, type(context.exception), "Failed to get initial token")
+
+    def test_execute_retries_after_expired_token(self):
+        mock_oauth: SpotifyOAuth = TokenManagerTest.__get_mock_oauth()
+        token_manager: TokenManager = TokenManager(oauth=mock_oauth).start()
+
+        mock_request: MagicMock = MagicMock()
+        mock_request.side_effect = [SpotifyException(401, -1, 'The access token expired'), 'result']
+
+        self.assertEqual('result', token_manager.execute(mock_request))
+        self.assertEqual(2, mock_request.call_count)
+        self.assertEqual('second_token', token_manager.get_access_token())
+        mock_oauth.refresh_access_token.assert_called_once_with('refresh_token')
+        token_manager.stop()
+
+    def test_execute_with_other_error(self):
+        mock_oauth: SpotifyOAuth = TokenManagerTest.__get_mock_oauth()
+        token_manager: TokenManager = TokenManager(oauth=mock_oauth).start()
+
+        mock_request: MagicMock = MagicMock()
+        mock_request.side_effect = SpotifyException(404, -1, 'Not found')
+
+        with self.assertRaises(SpotifyException):
+            token_manager.execute(mock_request)
+
+        mock_request.assert_called_once()
+        mock_oauth.refresh_access_token.assert_not_called()
+        token_manager.stop()
+
+    def test_refresh_skipped_when_token_already_refreshed(self):
+        mock_oauth: SpotifyOAuth = TokenManagerTest.__get_mock_oauth()
+        token_manager: TokenManager = TokenManager(oauth=mock_oauth).start()
+
+        token_manager.refresh(stale_token='first_token')
+        token_manager.refresh(stale_token='first_token')
+
+        mock_oauth.refresh_access_token.assert_called_once()
+        token_manager.stop()
+
+    def test_background_refresh_before_expiry(self):
+        mock_oauth: SpotifyOAuth = TokenManagerTest.__get_mock_oauth()
+        mock_oauth.validate_token.return_value['expires_at'] = int(time()) + 60
+        token_manager: TokenManager = TokenManager(oauth=mock_oauth, refresh_margin=120).start()
+
+        # The first token expires within the refresh margin, so the background refresh should fire straight away
+        for _ in range(100):
+            if token_manager.get_access_token() == 'second_token':
+                break
+            sleep(0.01)
+
+        self.assertEqual('second_token', token_manager.get_access_token())
+        mock_oauth.refresh_access_token.assert_called_once_with('refresh_token')
+        token_manager.stop()
@@ -1,7 +1,8 @@
+from datetime import datetime
 from exceptions.gpm.api_exceptions import UnauthenticatedClientException
 from gmusicapi import Mobileclient
 from meta.structures.track import GpmTrack
-from typing import List
+from typing import List, Tuple
 
 
 class ApiWrapper:
@@ -32,6 +33,42 @@ class ApiWrapper:
 
         return [ApiWrapper.__map_dict_to_gpm_track(track) for track in raw_tracks]
 
+    @staticmethod
+    def get_library_changes(mobile_client: Mobileclient,
+                            updated_after: int) -> Tuple[List[GpmTrack], List[str], int]:
+        """
+        Given an authenticated mobile client, return only the tracks that were added, modified or deleted in the user's
+        library since ``updated_after``. Used for incremental syncs, so a re-sync doesn't download the whole library.
+
+        Args:
+            mobile_client (Mobileclient): Must be authenticated. Client is used to retrieve the library changes for the
+                GPM user.
+            updated_after (int): Timestamp in microseconds, usually the latest ``last_modified`` seen by the previous
+                sync
+
+        Returns:
+            Tuple[List[GpmTrack], List[str], int]: The tracks added or modified since ``updated_after``, the ids of the
+                tracks deleted since then, and the latest ``lastModifiedTimestamp`` of the deleted tracks, None if none
+                were deleted. The high-water mark has to move past deletions too, or every sync would fetch them again
+
+        """
+        # Check if client isn't authenticated
+        if not mobile_client.is_authenticated():
+            raise UnauthenticatedClientException("Trying to get library changes with an unauthenticated mobile client")
+
+        # Skyjam returns deleted tracks as well when asked for the tracks updated after a point in time. gmusicapi
+        # converts the datetime back to a timestamp with time.mktime, so it has to be a naive datetime in local time
+        raw_tracks: List[dict] = mobile_client.get_all_songs(updated_after=datetime.fromtimestamp(updated_after / 1000000))
+
+        updated_tracks: List[GpmTrack] = [ApiWrapper.__map_dict_to_gpm_track(track) for track in raw_tracks
+                                          if not track.get('deleted')]
+        deleted_tracks: List[dict] = [track for track in raw_tracks if track.get('deleted')]
+        deleted_track_ids: List[str] = [track.get('id') for track in deleted_tracks]
+        deletion_timestamps: List[int] = [int(track['lastModifiedTimestamp']) for track in deleted_tracks
+                                          if track.get('lastModifiedTimestamp')]
+
+        return updated_tracks, deleted_track_ids, max(deletion_timestamps) if deletion_timestamps else None
+
     @staticmethod
     def __map_dict_to_gpm_track(track_dict: dict) -> GpmTrack:
         """
@@ -49,10 +86,19 @@ class ApiWrapper:
 
         """
 
+        rating: str = track_dict.get('rating')
+        last_played: str = track_dict.get('recentTimestamp') or track_dict.get('creationTimestamp')
+        last_modified: str = track_dict.get('lastModifiedTimestamp')
+
         return GpmTrack(
             title=track_dict.get('title'),
             artist=track_dict.get('artist'),
             album=track_dict.get('album'),
-            year=track_dict.get('year')
+            year=track_dict.get('year'),
+            play_count=track_dict.get('playCount', 0),
+            rating=int(rating) if rating else None,
+            last_played=int(last_played) if last_played else None,
+            track_id=track_dict.get('id'),
+            last_modified=int(last_modified) if last_modified else None
         )
 
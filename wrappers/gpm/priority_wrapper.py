@@ -0,0 +1,62 @@
+from meta.structures.track import GpmTrack
+from typing import Generator, List, Tuple
+
+
+class PriorityWrapper:
+    """
+    This class is responsible for ordering a GPM library so the tracks the user values most are migrated first. The
+    library is split into waves, each wave is matched and uploaded before the next one starts, so if a run is cut short
+    the user's favourite tracks are already in Spotify.
+
+    Attributes:
+        THUMBS_UP_PLAYS (int): How many plays a thumbs up is worth when ordering tracks
+    """
+
+    THUMBS_UP_PLAYS: int = 25
+
+    @staticmethod
+    def get_priority(gpm_track: GpmTrack) -> Tuple[bool, int, int]:
+        """
+        Get a sort key for a track, higher keys are migrated first. Thumbs down tracks always go last, the rest are
+        ordered by play count with a bonus for thumbs up, and ties are broken by the most recently played.
+
+        Args:
+            gpm_track (GpmTrack): The track to prioritise
+
+        Returns:
+            Tuple[bool, int, int]: The sort key for the track
+
+        """
+
+        rating: int = gpm_track.get_rating() or 0
+        plays: int = gpm_track.get_play_count() or 0
+
+        if rating >= 4:
+            plays += PriorityWrapper.THUMBS_UP_PLAYS
+
+        return rating != 1, plays, gpm_track.get_last_played() or 0
+
+    @staticmethod
+    def get_waves(gpm_library: List[GpmTrack], wave_size: int = 250) -> Generator[List[GpmTrack], None, None]:
+        """
+        Generator that orders the library by priority and splits it into waves
+
+        Args:
+            gpm_library (List[GpmTrack]): The user's GPM library
+            wave_size (int): Maximum number of tracks in each wave
+
+        Returns:
+            List[GpmTrack]: The next wave of tracks, highest priority first
+
+        Raises:
+            ValueError: When ``wave_size`` is less than 1
+
+        """
+
+        if wave_size < 1:
+            raise ValueError(f"Wave size must be at least 1, got {wave_size}. Check wave_size in cli-config.json")
+
+        ordered_library: List[GpmTrack] = sorted(gpm_library, key=PriorityWrapper.get_priority, reverse=True)
+
+        for start_index in range(0, len(ordered_library), wave_size):
+            yield ordered_library[start_index:start_index + wave_size]
@@ -0,0 +1,110 @@
+from json import dump, load
+from meta.structures.track import GpmTrack
+from os.path import exists
+from typing import List
+
+
+class SyncWrapper:
+    """
+    This Wrapper is responsible for keeping track of incremental syncs. It stores a high-water mark for each user, the
+    latest modification timestamp seen in their GPM library, so the next sync only needs to fetch the changes since.
+    """
+
+    @staticmethod
+    def get_high_water_mark(state_path: str, username: str) -> int:
+        """
+        Get the high-water mark stored by the user's last sync
+
+        Args:
+            state_path (str): Path to the file the sync state is stored in
+            username (str): The user that was synced
+
+        Returns:
+            int: Timestamp in microseconds of the latest change seen by the last sync, None if the user hasn't synced
+
+        """
+
+        if not exists(state_path):
+            return None
+
+        with open(state_path) as state_file:
+            return load(state_file).get(username)
+
+    @staticmethod
+    def save_high_water_mark(state_path: str, username: str, high_water_mark: int):
+        """
+        Store the high-water mark for the user's next sync, keeping the marks stored for other users
+
+        Args:
+            state_path (str): Path to the file the sync state is stored in
+            username (str): The user that was synced
+            high_water_mark (int): Timestamp in microseconds of the latest change seen by this sync
+
+        """
+
+        sync_state: dict = {}
+        if exists(state_path):
+            with open(state_path) as state_file:
+                sync_state = load(state_file)
+
+        sync_state[username] = high_water_mark
+
+        with open(state_path, 'w') as state_file:
+            dump(sync_state, state_file, indent=2)
+
+    @staticmethod
+    def complete_sync(state_path: str, username: str, gpm_tracks: List[GpmTrack], high_water_mark: int,
+                      failed_update_count: int, latest_deletion: int = None) -> bool:
+        """
+        Move the user's high-water mark past the tracks this sync fetched, but only if all of them made it to Spotify.
+        If any upload failed the mark is left where it was, so the next sync fetches those tracks again.
+
+        Args:
+            state_path (str): Path to the file the sync state is stored in
+            username (str): The user that was synced
+            gpm_tracks (List[GpmTrack]): The tracks fetched by this sync
+            high_water_mark (int): The high-water mark of the previous sync, None if this was the first sync
+            failed_update_count (int): The number of tracks that failed to upload, as returned by the ``LibraryWrapper``
+            latest_deletion (int): The latest modification timestamp of the tracks deleted since the last sync, as
+                returned by ``ApiWrapper.get_library_changes``
+
+        Returns:
+            bool: True if the high-water mark was saved
+
+        """
+
+        if failed_update_count > 0:
+            return False
+
+        latest_modification: int = SyncWrapper.get_latest_modification(gpm_tracks=gpm_tracks,
+                                                                        high_water_mark=high_water_mark,
+                                                                        latest_deletion=latest_deletion)
+        if latest_modification is None:
+            return False
+
+        SyncWrapper.save_high_water_mark(state_path=state_path, username=username, high_water_mark=latest_modification)
+
+        return True
+
+    @staticmethod
+    def get_latest_modification(gpm_tracks: List[GpmTrack], high_water_mark: int = None,
+                                latest_deletion: int = None) -> int:
+        """
+        Get the new high-water mark after syncing some tracks. Using the timestamps Skyjam gave us rather than the local
+        clock means a change made while the sync was running can't be missed.
+
+        Args:
+            gpm_tracks (List[GpmTrack]): The tracks fetched by this sync
+            high_water_mark (int): The high-water mark of the previous sync, kept if no track is newer
+            latest_deletion (int): The latest modification timestamp of the tracks deleted since the last sync
+
+        Returns:
+            int: The latest modification timestamp in microseconds, None if there isn't one
+
+        """
+
+        timestamps: List[int] = [gpm_track.get_last_modified() for gpm_track in gpm_tracks
+                                 if gpm_track.get_last_modified() is not None]
+        timestamps += [timestamp for timestamp in (high_water_mark, latest_deletion) if timestamp is not None]
+
+        return max(timestamps) if timestamps else None
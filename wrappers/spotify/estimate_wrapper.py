@@ -0,0 +1,145 @@
+from exceptions.spotify.search_exceptions import NoMatchException
+from math import ceil
+from meta.structures.estimate import MigrationEstimate
+from meta.structures.track import GpmTrack
+from random import Random
+from spotipy import Spotify
+from time import perf_counter
+from typing import Dict, List, Tuple
+from wrappers.spotify.search_wrapper import SearchWrapper
+
+
+class EstimateWrapper:
+    """
+    This class is responsible for estimating the cost of a migration without running it. It matches a random stratified
+    sample of the library against Spotify and extrapolates the results to the whole library.
+    """
+
+    @staticmethod
+    def estimate_migration(spotify_client: Spotify, gpm_library: List[GpmTrack], sample_size: int = 100,
+                           workers: int = 1, requests_per_second: float = None, batch_size: int = 50,
+                           seed: int = None) -> MigrationEstimate:
+        """
+        Match a sample of the library against Spotify and extrapolate the number of search calls, upload batches,
+        expected misses and wall time for migrating the whole library
+
+        Args:
+            spotify_client (Spotify): An authenticated Spotify Client
+            gpm_library (List[GpmTrack]): The user's GPM library
+            sample_size (int): Roughly how many tracks to match against Spotify. Each stratum of the library gets at
+                least one track, so the actual sample can be slightly larger
+            workers (int): How many requests the migration makes concurrently
+            requests_per_second (float): Optional. The rate limit the migration runs under
+            batch_size (int): How many tracks are uploaded to the user's library per call
+            seed (int): Optional. Seed for the random sample, so estimates can be reproduced
+
+        Returns:
+            MigrationEstimate: The estimated cost of the migration
+
+        Todo:
+            * Time an upload batch instead of assuming it takes as long as a search
+
+        """
+
+        library_size: int = len(gpm_library)
+        strata: Dict[Tuple[bool, bool], List[GpmTrack]] = EstimateWrapper.__stratify(gpm_library)
+        random: Random = Random(seed)
+
+        # Count the search calls made while matching the sample, a match can need a second, relaxed search. Counting
+        # goes through a wrapper so the caller's client is left untouched
+        counting_client: CountingClient = CountingClient(spotify_client)
+
+        match_rate, searches_per_track, sampled, match_time = 0.0, 0.0, 0, 0.0
+        for stratum in strata.values():
+            weight: float = len(stratum) / library_size
+            stratum_sample: List[GpmTrack] = random.sample(
+                stratum, min(len(stratum), max(1, round(sample_size * weight))))
+
+            matches, calls_before, stratum_time = 0, counting_client.search_calls, 0.0
+            for gpm_track in stratum_sample:
+                # Time the whole match, parsing & scoring the results costs as much per track as the searches
+                start: float = perf_counter()
+                try:
+                    SearchWrapper.get_spotify_match(spotify_client=counting_client, gpm_track=gpm_track)
+                    matches += 1
+                except NoMatchException:
+                    pass
+                stratum_time += perf_counter() - start
+
+            # Weight each stratum by its share of the library
+            match_rate += weight * matches / len(stratum_sample)
+            searches_per_track += weight * (counting_client.search_calls - calls_before) / len(stratum_sample)
+            match_time += weight * stratum_time / len(stratum_sample)
+            sampled += len(stratum_sample)
+
+        total_search_calls: int = ceil(library_size * searches_per_track)
+        expected_misses: int = round(library_size * (1 - match_rate))
+        upload_batches: int = ceil((library_size - expected_misses) / batch_size)
+
+        # Upload batches are assumed to take as long as a search call
+        upload_time: float = upload_batches * match_time / searches_per_track if searches_per_track else 0.0
+
+        total_calls: int = total_search_calls + upload_batches
+        wall_time: float = (library_size * match_time + upload_time) / max(1, workers)
+        if requests_per_second:
+            wall_time = max(wall_time, total_calls / requests_per_second)
+
+        return MigrationEstimate(
+            library_size=library_size,
+            unique_tracks=len({(track.get_title(), track.get_artist(), track.get_album()) for track in gpm_library}),
+            album_count=len({(track.get_artist(), track.get_album()) for track in gpm_library if track.get_album()}),
+            sample_size=sampled,
+            match_rate=match_rate,
+            searches_per_track=searches_per_track,
+            match_time=match_time,
+            search_calls=total_search_calls,
+            upload_batches=upload_batches,
+            expected_misses=expected_misses,
+            wall_time=wall_time
+        )
+
+    @staticmethod
+    def __stratify(gpm_library: List[GpmTrack]) -> Dict[Tuple[bool, bool], List[GpmTrack]]:
+        """
+        Group the library by which optional attributes the tracks have. Tracks without an album or year are harder to
+        match, so sampling each group separately stops the sample over or under representing them.
+
+        Args:
+            gpm_library (List[GpmTrack]): The user's GPM library
+
+        Returns:
+            Dict[Tuple[bool, bool], List[GpmTrack]]: The tracks keyed by whether they have an album and a year
+
+        """
+
+        strata: Dict[Tuple[bool, bool], List[GpmTrack]] = {}
+        for gpm_track in gpm_library:
+            strata.setdefault((bool(gpm_track.get_album()), bool(gpm_track.get_year())), []).append(gpm_track)
+
+        return strata
+
+
+class CountingClient:
+    """
+    A thin wrapper around a Spotify client that counts the search calls made through it. Every other attribute is
+    passed straight through to the wrapped client.
+
+    Attributes:
+        search_calls (int): The number of search calls made through the wrapper
+    """
+
+    def __init__(self, spotify_client: Spotify):
+        self.search_calls: int = 0
+        self.__spotify_client: Spotify = spotify_client
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.__spotify_client, name)
+
+        if name not in ('search', 'search_raw'):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self.search_calls += 1
+            return attribute(*args, **kwargs)
+
+        return counted
@@ -0,0 +1,50 @@
+from requests.exceptions import HTTPError, RetryError
+from spotipy import Spotify, SpotifyException
+
+
+class LeanSpotify(Spotify):
+    """
+    A Spotify client that can return the raw body of a search response instead of the parsed dict. spotipy parses every
+    response with the standard json module, search responses are large and we only need a few fields of each result,
+    so the ``SearchWrapper`` decodes the raw body itself.
+    """
+
+    def search_raw(self, q: str, limit: int = 10, offset: int = 0, type: str = 'track', market: str = None) -> bytes:
+        """
+        Same as ``Spotify.search``, except the response body is returned undecoded
+
+        Args:
+            q (str): The search query
+            limit (int): The number of items to return, max 50
+            offset (int): The index of the first item to return
+            type (str): The types of items to return
+            market (str): An ISO 3166-1 alpha-2 country code or the string from_token
+
+        Returns:
+            bytes: The raw JSON body of the search response
+
+        Raises:
+            SpotifyException: When the Spotify API returns an error status, in the same form as the parsed search would
+
+        """
+
+        params: dict = {'q': q, 'limit': limit, 'offset': offset, 'type': type}
+        if market is not None:
+            params['market'] = market
+
+        headers: dict = self._auth_headers()
+        if self.language is not None:
+            headers['Accept-Language'] = self.language
+
+        try:
+            response = self._session.get(self.prefix + 'search', headers=headers, params=params,
+                                         proxies=self.proxies, timeout=self.requests_timeout)
+            response.raise_for_status()
+        except HTTPError as http_error:
+            response = http_error.response
+            raise SpotifyException(response.status_code, -1, f"{response.url}:\n {response.text or None}",
+                                   headers=response.headers)
+        except RetryError:
+            raise SpotifyException(429, -1, "search:\n Max Retries")
+
+        return response.content
@@ -1,11 +1,12 @@
 from spotipy import Spotify
 from typing import List
+from wrappers.spotify.token_manager import TokenManager
 
 
 class LibraryWrapper:
 
     @staticmethod
-    def update_user_library(spotify: Spotify, uris: List[str]) -> int:
+    def update_user_library(spotify: Spotify, uris: List[str], token_manager: TokenManager = None) -> int:
         """
         This method takes an authenticated spotify object for a user with the correct scope required to update the users
         saved tracks, and a list of tracks to update the users shared library with
@@ -13,6 +14,8 @@ class LibraryWrapper:
         Args:
             spotify (Spotify): An authenticated spotify object to update a user's library with
             uris (List[str]): A list of URIs to update the user's library with
+            token_manager (TokenManager): Optional. When supplied, a batch rejected because the access token expired is
+                retried once after refreshing the token
 
         Returns:
             int: Representing the number of tracks we failed to update
@@ -30,8 +33,12 @@ class LibraryWrapper:
         failed_update_count: int = 0
         for uri_subset in LibraryWrapper.__uri_subset_generator(uris):
             try:
-                spotify.current_user_saved_tracks_add(uri_subset)
-            except: # Catch any error for now, loop back to error handling
+                if token_manager is None:
+                    spotify.current_user_saved_tracks_add(uri_subset)
+                else:
+                    token_manager.execute(lambda: spotify.current_user_saved_tracks_add(uri_subset))
+            except Exception as e:  # Catch any error for now, loop back to error handling
+                print(f"Failed to add {len(uri_subset)} tracks to the library: {e}")
                 failed_update_count += len(uri_subset)
 
         return failed_update_count
@@ -2,15 +2,22 @@ from exceptions.spotify.search_exceptions import NoMatchException
 from rapidfuzz import fuzz
 from meta.structures.track import GpmTrack, SpotifyTrack
 from spotipy import Spotify
-from typing import Tuple
+from typing import List, Tuple
+
+import orjson
 
 
 class SearchWrapper:
     """
     This class is responsible for interfacing with the Search Service. It should map google play music tracks to spotify
     tracks.
+
+    Attributes:
+        SCORED_ATTRIBUTES (Tuple[str]): The GpmTrack attributes compared with each search result when scoring a match
     """
 
+    SCORED_ATTRIBUTES: Tuple[str] = ('title', 'artist', 'album', 'year', 'genre')
+
     @staticmethod
     def get_spotify_match(spotify_client: Spotify, gpm_track: GpmTrack) -> SpotifyTrack:
         """
@@ -35,24 +42,22 @@ class SearchWrapper:
         search_string: str = SearchWrapper.__get_search_query(gpm_track=gpm_track)
 
         # Search Spotify API using all available criteria
-        search_results: dict = (spotify_client.search(q=search_string, type='track', limit=50))['tracks']
+        search_results: List[SpotifyTrack] = SearchWrapper.__search(spotify_client=spotify_client,
+                                                                    search_string=search_string)
 
         # If we didn't get any results, relax the critetia and search again
-        if search_results['total'] == 0:
+        if len(search_results) == 0:
             search_string: str = SearchWrapper.__get_search_query(gpm_track=gpm_track, attributes_filter=('album','artist'))
-            search_results: dict = spotify_client.search(q=search_string, type='track', limit=50)['tracks']
+            search_results: List[SpotifyTrack] = SearchWrapper.__search(spotify_client=spotify_client,
+                                                                        search_string=search_string)
 
-            if search_results['total'] == 0:
+            if len(search_results) == 0:
                 # Give up, we still dont have any matches
                 raise NoMatchException(f"No match for {gpm_track.get_title()} - {gpm_track.get_artist()} - {gpm_track.get_album()} - {search_string}")
 
-        # We have results, parse the items
-        search_results = search_results['items']
-
         # Set the best result to a placeholder with an impossible score
         best_result: SpotifyTrack = SpotifyTrack(title='Placeholder', artist='Placeholder', uri='test', score=-1)
-        for result in search_results:
-            current_result: SpotifyTrack = SearchWrapper.__parse_result_to_track(result)
+        for current_result in search_results:
             result_score: int = SearchWrapper.__score_match(gpm_track=gpm_track, spotify_track=current_result)
 
             current_result.set_score(score=result_score)
@@ -61,6 +66,48 @@ class SearchWrapper:
 
         return best_result
 
+    @staticmethod
+    def parse_search_response(response: bytes) -> List[SpotifyTrack]:
+        """
+        Decode the raw body of a track search response and parse its items into SpotifyTracks. orjson decodes the body
+        much faster than the json module, and only the fields we score on are kept from each item, so the decoded
+        document can be dropped as soon as the items are parsed.
+
+        Args:
+            response (bytes): The raw JSON body of a track search response from the Spotify API
+
+        Returns:
+            List[SpotifyTrack]: The search results, empty if there were none
+
+        """
+
+        items: List[dict] = orjson.loads(response)['tracks']['items']
+
+        return [SearchWrapper.__parse_result_to_track(item) for item in items]
+
+    @staticmethod
+    def __search(spotify_client: Spotify, search_string: str) -> List[SpotifyTrack]:
+        """
+        Search Spotify for tracks. A client with ``search_raw``, like ``LeanSpotify``, gets the raw response so it can be
+        decoded by ``parse_search_response``, any other client falls back to the search results spotipy already parsed.
+
+        Args:
+            spotify_client (Spotify): An authenticated Spotify Client
+            search_string (str): A Spotify Search String
+
+        Returns:
+            List[SpotifyTrack]: The search results, empty if there were none
+
+        """
+
+        if hasattr(spotify_client, 'search_raw'):
+            return SearchWrapper.parse_search_response(spotify_client.search_raw(q=search_string, type='track',
+                                                                                 limit=50))
+
+        items: List[dict] = spotify_client.search(q=search_string, type='track', limit=50)['tracks']['items']
+
+        return [SearchWrapper.__parse_result_to_track(item) for item in items]
+
     @staticmethod
     def __get_search_query(gpm_track: GpmTrack, attributes_filter: Tuple[str] = ()) -> str:
         """
@@ -101,7 +148,8 @@ class SearchWrapper:
     @staticmethod
     def __parse_result_to_track(result: dict) -> SpotifyTrack:
         """
-        This method should parse a single track result from the Spotify API into a SpotifyTrack object
+        This method should parse a single track result from the Spotify API into a SpotifyTrack object. Only the fields we
+        need are read, so nothing else from the result (markets, image lists, external urls) is kept alive.
 
         Args:
             result (dict): A Dict representing a track search result from the Spotify API
@@ -115,19 +163,23 @@ class SearchWrapper:
 
         """
 
+        album: dict = result['album']
+        images: List[dict] = album.get('images')
+
         return SpotifyTrack(
             title=result['name'],
             artist=result['artists'][0]['name'],
-            album=result['album']['name'],
-            album_art_url=result['album']['images'],
+            album=album['name'],
+            album_art_url=images[0]['url'] if images else None,
             uri=result['uri'],
-            year=result['album']['release_date'][0:4]
+            year=album['release_date'][0:4],
+            duration=result.get('duration_ms')
         )
 
     @staticmethod
     def __score_match(gpm_track: GpmTrack, spotify_track: SpotifyTrack) -> int:
         """
-        Using the gpm_track as the reference object, get each of the gpm track's attributes and compare it with the
+        Using the gpm_track as the reference object, get each of the gpm track's scored attributes and compare it with the
         spotify track using fuzzy matching, then get the average score for each attribute.
 
         Args:
@@ -144,7 +196,7 @@ class SearchWrapper:
         gpm_dict: dict = vars(gpm_track)
         spotify_dict: dict = vars(spotify_track)
 
-        for key in gpm_dict:
+        for key in SearchWrapper.SCORED_ATTRIBUTES:
             gpm_value: str = str(gpm_dict.get(key)).lower()
             spotify_value: str = str(spotify_dict.get(key)).lower()
 
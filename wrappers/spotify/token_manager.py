@@ -0,0 +1,208 @@
+from exceptions.spotify.auth_exceptions import SpotifyAuthException
+from spotipy import SpotifyException
+from spotipy.oauth2 import SpotifyOAuth
+from threading import Lock, Timer
+from time import time
+from typing import Callable, TypeVar
+from wrappers.spotify.lean_spotify import LeanSpotify
+
+T = TypeVar('T')
+
+
+class TokenManager:
+    """
+    The TokenManager owns the Spotify access token for the lifetime of a migration. Spotify tokens expire after an hour,
+    so the manager refreshes the token in the background shortly before it expires, and hands the current token to
+    every request made through a client built by ``get_spotify_client``.
+
+    Attributes:
+        oauth (SpotifyOAuth): The oauth manager used to acquire and refresh tokens
+        refresh_margin (int): How many seconds before expiry the background refresh should happen
+        retry_delay (int): How many seconds to wait before retrying a failed background refresh
+    """
+
+    def __init__(self, oauth: SpotifyOAuth, refresh_margin: int = 300, retry_delay: int = 30):
+        self.oauth: SpotifyOAuth = oauth
+        self.refresh_margin: int = refresh_margin
+        self.retry_delay: int = retry_delay
+
+        self.__lock: Lock = Lock()
+        self.__token_info: dict = None
+        self.__timer: Timer = None
+        self.__running: bool = False
+
+    def start(self) -> 'TokenManager':
+        """
+        Get the initial token, prompting the user to log in if there is no valid cached token, then schedule the first
+        background refresh
+
+        Returns:
+            TokenManager: This token manager, so it can be chained from the constructor
+
+        Raises:
+            SpotifyAuthException: When we fail to get an initial token for the user
+
+        """
+
+        try:
+            token_info: dict = self.oauth.validate_token(self.oauth.cache_handler.get_cached_token())
+
+            if token_info is None:
+                self.oauth.get_access_token(code=self.oauth.get_auth_response(), as_dict=False)
+                token_info = self.oauth.cache_handler.get_cached_token()
+        except Exception as e:
+            raise SpotifyAuthException(e)
+
+        if token_info is None:
+            raise SpotifyAuthException("Failed to get an access token for the Spotify API")
+
+        with self.__lock:
+            self.__token_info = token_info
+            self.__running = True
+            self.__schedule_refresh()
+
+        return self
+
+    def stop(self):
+        """
+        Cancel any pending background refresh. Should be called once the migration is finished.
+        """
+
+        with self.__lock:
+            self.__running = False
+
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+
+    def get_access_token(self, as_dict: bool = False):
+        """
+        Get the current access token. The signature matches spotipy's auth managers, so a ``Spotify`` client built with
+        this manager as its ``auth_manager`` will use the current token for every request.
+
+        Args:
+            as_dict (bool): Return the whole token info dict instead of just the access token
+
+        Returns:
+            The current access token, or the token info dict if ``as_dict`` is set
+
+        Raises:
+            SpotifyAuthException: When the manager hasn't been started
+
+        """
+
+        token_info: dict = self.__token_info
+
+        if token_info is None:
+            raise SpotifyAuthException("Token manager has not been started")
+
+        return dict(token_info) if as_dict else token_info['access_token']
+
+    def get_spotify_client(self) -> LeanSpotify:
+        """
+        Returns:
+            LeanSpotify: A Spotify client that always authenticates with the manager's current token
+
+        """
+
+        return LeanSpotify(auth_manager=self)
+
+    def refresh(self, stale_token: str = None) -> str:
+        """
+        Refresh the access token now and reschedule the background refresh. When ``stale_token`` is given, the refresh is
+        skipped if the token has already changed, so several requests failing with the same expired token only cause one
+        refresh.
+
+        Args:
+            stale_token (str): The access token that was rejected by the Spotify API
+
+        Returns:
+            str: The new access token
+
+        Raises:
+            SpotifyAuthException: When the refresh request fails
+
+        """
+
+        with self.__lock:
+            if self.__token_info is None:
+                raise SpotifyAuthException("Token manager has not been started")
+
+            if stale_token is None or self.__token_info['access_token'] == stale_token:
+                try:
+                    token_info: dict = self.oauth.refresh_access_token(self.__token_info['refresh_token'])
+                except Exception as e:
+                    raise SpotifyAuthException(e)
+
+                if token_info is None:
+                    raise SpotifyAuthException("Spotify returned an empty response when refreshing the access token")
+
+                self.__token_info = token_info
+                self.__schedule_refresh()
+
+            return self.__token_info['access_token']
+
+    def execute(self, request: Callable[[], T]) -> T:
+        """
+        Run a request against the Spotify API. If it's rejected because the token expired, refresh the token and retry
+        the request once, so the work isn't dropped.
+
+        Args:
+            request (Callable[[], T]): A callable making the request, using a client from ``get_spotify_client``
+
+        Returns:
+            T: Whatever the request returns
+
+        Raises:
+            SpotifyException: When the request fails for any reason other than an expired token, or fails again after
+                the refresh
+
+        """
+
+        token: str = self.get_access_token()
+
+        try:
+            return request()
+        except SpotifyException as e:
+            if e.http_status != 401:
+                raise
+
+        self.refresh(stale_token=token)
+
+        return request()
+
+    def __schedule_refresh(self, delay: float = None):
+        """
+        Schedule the next background refresh, unless the manager has been stopped. Must be called while holding the lock.
+
+        Args:
+            delay (float): Seconds until the refresh. Defaults to ``refresh_margin`` seconds before the token expires
+
+        """
+
+        if not self.__running:
+            return
+
+        if delay is None:
+            delay = max(0, self.__token_info['expires_at'] - self.refresh_margin - time())
+
+        if self.__timer is not None:
+            self.__timer.cancel()
+
+        self.__timer = Timer(delay, self.__background_refresh)
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def __background_refresh(self):
+        """
+        Runs on the timer thread. A failed refresh is retried after ``retry_delay`` seconds rather than giving up, the
+        current token stays in use until then.
+        """
+
+        try:
+            self.refresh()
+        except SpotifyAuthException as e:
+            print(f"Failed to refresh Spotify access token, retrying in {self.retry_delay} seconds:\n {e}")
+
+            with self.__lock:
+                self.__schedule_refresh(delay=self.retry_delay)